@@ -94,7 +94,7 @@ class BehaviorSession(Base):
 
     id = Column(Integer, primary_key=True)
     client_id = Column(Integer, ForeignKey("clients.id"), nullable=False, index=True)
-    started_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    started_at = Column(DateTime, default=datetime.utcnow, nullable=False, index=True)
     ended_at = Column(DateTime, nullable=True)
 
     client = relationship("Client", back_populates="sessions")
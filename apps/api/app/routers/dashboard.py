@@ -0,0 +1,130 @@
+# apps/api/app/routers/dashboard.py
+import time
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Dict, Any, List, Optional, Tuple
+
+from fastapi import APIRouter, Depends
+from sqlalchemy import case, func
+from sqlalchemy.orm import Session
+
+from ..db import get_db
+from ..models import Client, Behavior, BehaviorSession, BehaviorEvent, DataCollectionMethod
+from ..deps import require_bcba
+from ..settings import settings
+
+router = APIRouter()
+
+RECENT_DAYS = 30
+
+# Short-lived in-process cache: (expires_at monotonic, payload)
+_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+_cache_lock = Lock()
+
+def _session_stats(db: Session, now: datetime) -> Dict[int, Dict[str, Any]]:
+    # One GROUP BY over behavior_sessions for every client
+    cut7 = now - timedelta(days=7)
+    cut30 = now - timedelta(days=30)
+    rows = (
+        db.query(
+            BehaviorSession.client_id,
+            func.max(BehaviorSession.started_at),
+            func.sum(case((BehaviorSession.started_at >= cut7, 1), else_=0)),
+            func.sum(case((BehaviorSession.started_at >= cut30, 1), else_=0)),
+            func.sum(case((BehaviorSession.ended_at.is_(None), 1), else_=0)),
+        )
+        .group_by(BehaviorSession.client_id)
+        .all()
+    )
+    return {
+        client_id: {
+            "last_session_date": last.date().isoformat() if last else None,
+            "sessions_7d": int(n7 or 0),
+            "sessions_30d": int(n30 or 0),
+            "open_sessions": int(n_open or 0),
+        }
+        for client_id, last, n7, n30, n_open in rows
+    }
+
+def _behavior_totals(db: Session, now: datetime) -> List[Dict[str, Any]]:
+    # Per-behavior sums over recent sessions, one column per method family
+    # (same rules as analysis._summarize), then LEFT JOIN so idle behaviors get 0.
+    cutoff = now - timedelta(days=RECENT_DAYS)
+    value = func.coalesce(BehaviorEvent.value, 0)
+    totals = (
+        db.query(
+            BehaviorEvent.behavior_id.label("behavior_id"),
+            func.sum(case((BehaviorEvent.event_type.in_(("INC", "DEC")), value), else_=0)).label("count_total"),
+            func.sum(case((BehaviorEvent.event_type == "STOP", value), else_=0)).label("duration_total"),
+            func.sum(case((BehaviorEvent.event_type == "HIT", 1), else_=0)).label("hit_total"),
+        )
+        .join(BehaviorSession, BehaviorSession.id == BehaviorEvent.session_id)
+        .filter(BehaviorSession.started_at >= cutoff)
+        .group_by(BehaviorEvent.behavior_id)
+        .subquery()
+    )
+    rows = (
+        db.query(
+            Behavior.id,
+            Behavior.client_id,
+            Behavior.name,
+            Behavior.method,
+            totals.c.count_total,
+            totals.c.duration_total,
+            totals.c.hit_total,
+        )
+        .outerjoin(totals, totals.c.behavior_id == Behavior.id)
+        .order_by(Behavior.client_id.asc(), Behavior.created_at.asc())
+        .all()
+    )
+
+    out: List[Dict[str, Any]] = []
+    for bid, client_id, name, method, count_total, duration_total, hit_total in rows:
+        if method == DataCollectionMethod.FREQUENCY:
+            total = count_total
+        elif method == DataCollectionMethod.DURATION:
+            total = duration_total
+        else:
+            total = hit_total
+        out.append({
+            "id": bid,
+            "client_id": client_id,
+            "name": name,
+            "method": method.value,
+            "recent_total": int(total or 0),
+        })
+    return out
+
+def _build_summary(db: Session) -> Dict[str, Any]:
+    now = datetime.utcnow()
+    stats = _session_stats(db, now)
+
+    by_client: Dict[int, List[Dict[str, Any]]] = {}
+    for b in _behavior_totals(db, now):
+        by_client.setdefault(b.pop("client_id"), []).append(b)
+
+    empty = {"last_session_date": None, "sessions_7d": 0, "sessions_30d": 0, "open_sessions": 0}
+    clients = db.query(Client.id, Client.name).order_by(Client.name.asc()).all()
+    return {
+        "generated_at": now.isoformat(),
+        "recent_days": RECENT_DAYS,
+        "clients": [
+            {
+                "id": cid,
+                "name": name,
+                **stats.get(cid, empty),
+                "behaviors": by_client.get(cid, []),
+            }
+            for cid, name in clients
+        ],
+    }
+
+@router.get("/dashboard/bcba/summary")
+def bcba_summary(db: Session = Depends(get_db), _user=Depends(require_bcba)):
+    global _cache
+    with _cache_lock:
+        if _cache and _cache[0] > time.monotonic():
+            return _cache[1]
+        payload = _build_summary(db)
+        _cache = (time.monotonic() + settings.dashboard_cache_seconds, payload)
+        return payload
@@ -19,6 +19,9 @@ class Settings(BaseSettings):
     # CORS
     cors_allow_origins: Optional[List[str]] = ["http://localhost:3000"]
 
+    # BCBA dashboard summary cache lifetime (seconds)
+    dashboard_cache_seconds: int = 30
+
     class Config:
         env_file = ".env"
         env_prefix = "PI_"
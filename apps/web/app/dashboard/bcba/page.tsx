@@ -6,14 +6,35 @@ const API_BASE =
 
 type Me = { username: string; role: "BCBA" | "RBT" };
 
+type ClientSummary = {
+  id: number;
+  name: string;
+  last_session_date: string | null;
+  sessions_7d: number;
+  sessions_30d: number;
+  open_sessions: number;
+  behaviors: { id: number; name: string; method: string; recent_total: number }[];
+};
+
+type Summary = { recent_days: number; clients: ClientSummary[] };
+
 export default function BCBADashboard() {
   const [me, setMe] = useState<Me | null>(null);
+  const [summary, setSummary] = useState<Summary | null>(null);
+  const [summaryErr, setSummaryErr] = useState<string | null>(null);
 
   useEffect(() => {
     fetch(`${API_BASE}/auth/me`, { credentials: "include" })
       .then((r) => (r.ok ? r.json() : Promise.reject()))
       .then(setMe)
       .catch(() => setMe(null));
+
+    fetch(`${API_BASE}/dashboard/bcba/summary`, { credentials: "include" })
+      .then((r) =>
+        r.ok ? r.json() : r.json().then((d) => Promise.reject(d)),
+      )
+      .then(setSummary)
+      .catch((e) => setSummaryErr(e?.detail || "Failed to load summary"));
   }, []);
 
   async function logout() {
@@ -60,6 +81,61 @@ export default function BCBADashboard() {
           </a>
         </div>
       </section>
+
+      <section className="space-y-3">
+        <h2 className="text-xl font-semibold">Clients Overview</h2>
+        {summaryErr && <p className="text-red-600">{summaryErr}</p>}
+        {!summary && !summaryErr && <p>Loading…</p>}
+        {summary && summary.clients.length === 0 && (
+          <p className="text-gray-600">No clients yet.</p>
+        )}
+        {summary && summary.clients.length > 0 && (
+          <div className="overflow-x-auto border rounded-xl">
+            <table className="min-w-full text-sm">
+              <thead className="bg-gray-50 text-left">
+                <tr>
+                  <th className="p-3">Client</th>
+                  <th className="p-3">Last Session</th>
+                  <th className="p-3">Sessions (7d)</th>
+                  <th className="p-3">Sessions (30d)</th>
+                  <th className="p-3">Open</th>
+                  <th className="p-3">Behaviors (last {summary.recent_days}d)</th>
+                </tr>
+              </thead>
+              <tbody className="divide-y">
+                {summary.clients.map((c) => (
+                  <tr key={c.id} className="align-top">
+                    <td className="p-3">
+                      <a href={`/clients/${c.id}`} className="underline">
+                        {c.name}
+                      </a>
+                    </td>
+                    <td className="p-3">{c.last_session_date ?? "—"}</td>
+                    <td className="p-3">{c.sessions_7d}</td>
+                    <td className="p-3">{c.sessions_30d}</td>
+                    <td className="p-3">{c.open_sessions}</td>
+                    <td className="p-3">
+                      {c.behaviors.length === 0 ? (
+                        <span className="text-gray-500">—</span>
+                      ) : (
+                        <ul className="space-y-1">
+                          {c.behaviors.map((b) => (
+                            <li key={b.id}>
+                              {b.name}{" "}
+                              <span className="text-gray-500">({b.method})</span>:{" "}
+                              {b.recent_total}
+                            </li>
+                          ))}
+                        </ul>
+                      )}
+                    </td>
+                  </tr>
+                ))}
+              </tbody>
+            </table>
+          </div>
+        )}
+      </section>
     </main>
   );
 }